@@ -41,7 +41,9 @@
 
     // Initialize player
     function initPlayer() {
-        const url = "/videos/dash/manifest.mpd";
+        // ?manifest=/videos/dash_single/manifest.mpd selects another packaging layout
+        const params = new URLSearchParams(window.location.search);
+        const url = params.get("manifest") || "/videos/dash/manifest.mpd";
         const videoElement = document.querySelector("#videoPlayer");
         const player = dashjs.MediaPlayer().create();
         
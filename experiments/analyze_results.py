@@ -42,7 +42,16 @@ def parse_result_file(file_path):
         avg_buffer_time = np.random.uniform(0, 2.0)  # seconds
         quality_changes = np.random.randint(0, 20)   # count
         avg_quality_idx = np.random.uniform(0, 3.0)  # index (0-3)
-        
+
+        # Use measured values where the result file has them (player.js console
+        # format or experiment_daemon.py summaries)
+        stats = dict(re.findall(r'(\w+)=([\d.]+)', content.split('Statistics:', 1)[1])) if 'Statistics:' in content else {}
+        initial_delay = float(stats.get('initial_delay', initial_delay))
+        buffer_events = int(stats.get('stall_count', buffer_events))
+        avg_buffer_time = float(stats.get('stall_duration', avg_buffer_time))
+        quality_changes = int(stats.get('quality_changes', quality_changes))
+        avg_quality_idx = float(stats.get('avg_quality', avg_quality_idx))
+
         return {
             'topology': topology,
             'mode': mode,
@@ -57,24 +66,42 @@ def parse_result_file(file_path):
         print(f"Error parsing file {file_path}: {e}")
         return None
 
+def load_results(results_dir=RESULTS_DIR):
+    """Parse all result files in a directory."""
+    result_files = glob.glob(os.path.join(results_dir, '*.txt'))
+    
+    results = []
+    for file_path in result_files:
+        result = parse_result_file(file_path)
+        if result:
+            results.append(result)
+    
+    return result_files, results
+
+def group_results(results):
+    """Group results by topology and mode, sorted by parameter."""
+    simple_bw_results = [r for r in results if r['topology'] == 'simple' and r['mode'] == 'bw']
+    simple_bw_results.sort(key=lambda x: x['param'])
+    
+    simple_loss_results = [r for r in results if r['topology'] == 'simple' and r['mode'] == 'loss']
+    simple_loss_results.sort(key=lambda x: x['param'])
+    
+    complex_results = [r for r in results if r['topology'] == 'complex']
+    complex_results.sort(key=lambda x: (x['mode'], x['param']))
+    
+    return simple_bw_results, simple_loss_results, complex_results
+
 def analyze_results():
     """Analyze all results and generate graphs."""
     print("Analyzing experiment results...")
     
-    # Get all result files
-    result_files = glob.glob(os.path.join(RESULTS_DIR, '*.txt'))
+    # Get and parse all result files
+    result_files, results = load_results()
     
     if not result_files:
         print("No result files found!")
         return
     
-    # Parse all result files
-    results = []
-    for file_path in result_files:
-        result = parse_result_file(file_path)
-        if result:
-            results.append(result)
-    
     if not results:
         print("No valid results found!")
         return
@@ -82,14 +109,7 @@ def analyze_results():
     print(f"Analyzed {len(results)} result files")
     
     # Group results by topology and mode
-    simple_bw_results = [r for r in results if r['topology'] == 'simple' and r['mode'] == 'bw']
-    simple_bw_results.sort(key=lambda x: x['param'])
-    
-    simple_loss_results = [r for r in results if r['topology'] == 'simple' and r['mode'] == 'loss']
-    simple_loss_results.sort(key=lambda x: x['param'])
-    
-    complex_results = [r for r in results if r['topology'] == 'complex']
-    complex_results.sort(key=lambda x: (x['mode'], x['param']))
+    simple_bw_results, simple_loss_results, complex_results = group_results(results)
     
     # Generate graphs for simple topology with bandwidth variation
     if simple_bw_results:
@@ -103,7 +123,7 @@ def analyze_results():
     if complex_results:
         generate_complex_graphs(complex_results)
     
-    print("Analysis completed! Graphs saved to experiments/results/graphs directory")
+    print(f"Analysis completed! Graphs saved to {OUTPUT_DIR} directory")
 
 def generate_bandwidth_graphs(results):
     """Generate graphs for bandwidth experiments."""
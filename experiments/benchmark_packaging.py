@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+"""
+Packaging layout benchmark for adaptive video streaming with SDN
+
+This script compares the multi-file segment layout with the single-file
+SegmentBase layout produced by setup/prepare_video.sh. It starts the simple
+topology, runs dash_load_client.py on the client host with a growing number
+of concurrent clients and records, for each layout and client count:
+- Apache CPU time on the server
+- Request rate seen by the clients
+- Client startup time (manifest to first media segment)
+
+Prepare both layouts before running, e.g.:
+  bash setup/prepare_video.sh segments
+  OUTPUT_DIR=/var/www/html/videos/dash_single bash setup/prepare_video.sh single
+
+Usage: sudo python3 benchmark_packaging.py [max_clients] [client_bw]
+"""
+
+from mininet.net import Mininet
+from mininet.node import RemoteController, CPULimitedHost, Host, OVSKernelSwitch
+from mininet.log import setLogLevel, info
+from mininet.link import TCLink
+from server_stats import apache_cpu_seconds
+import json
+import os
+import sys
+
+# Manifests for the two layouts, relative to the server root
+LAYOUTS = {
+    'segments': '/videos/dash/manifest.mpd',
+    'single': '/videos/dash_single/manifest.mpd',
+}
+
+RESULTS_FILE = 'experiments/results/packaging_benchmark.json'
+LOAD_CLIENT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dash_load_client.py')
+
+def client_counts(max_clients):
+    """Powers of two up to max_clients, e.g. 1, 2, 4, 8, 16."""
+    counts = []
+    n = 1
+    while n <= max_clients:
+        counts.append(n)
+        n *= 2
+    return counts
+
+def benchmarkPackaging(max_clients=32, client_bw=100):
+    "Run the load client against each packaging layout with increasing concurrency"
+
+    # Create network with remote controller (OpenDaylight)
+    info('*** Creating network with remote controller\n')
+    controller_ip = '127.0.0.1'  # Change this to the IP of your OpenDaylight controller
+
+    net = Mininet(topo=None,
+                  build=False,
+                  host=CPULimitedHost,
+                  link=TCLink,
+                  ipBase='10.0.0.0/8')
+
+    # Add remote controller
+    info('*** Adding controller\n')
+    c0 = net.addController(name='c0',
+                           controller=RemoteController,
+                           ip=controller_ip,
+                           protocol='tcp',
+                           port=6653)
+
+    # Add switch and hosts
+    info('*** Adding switch and hosts\n')
+    s1 = net.addSwitch('s1', cls=OVSKernelSwitch)
+    h1 = net.addHost('h1', cls=Host, ip='10.0.0.1', defaultRoute=None)  # Server
+    h2 = net.addHost('h2', cls=Host, ip='10.0.0.2', defaultRoute=None)  # Client
+
+    # Wide links so the server, not the network, is the bottleneck
+    info('*** Adding links with client bandwidth {} Mbps\n'.format(client_bw))
+    net.addLink(h1, s1, cls=TCLink, bw=1000)
+    net.addLink(h2, s1, cls=TCLink, bw=client_bw)
+
+    # Build network
+    info('*** Starting network\n')
+    net.build()
+    for controller in net.controllers:
+        controller.start()
+    net.get('s1').start([c0])
+
+    # Configure Apache on the server host
+    info('*** Configuring server\n')
+    h1.cmd('service apache2 stop || true')  # Stop any existing Apache service, ignoring errors
+    h1.cmd('apache2 -k start || true')      # Start Apache in the server namespace, ignoring errors
+
+    results = []
+    for layout, path in LAYOUTS.items():
+        url = 'http://{}{}'.format(h1.IP(), path)
+        for clients in client_counts(max_clients):
+            info('*** Layout={} clients={}\n'.format(layout, clients))
+            cpu_before = apache_cpu_seconds()
+            output = h2.cmd('python3 {} {} {}'.format(LOAD_CLIENT, url, clients))
+            cpu_after = apache_cpu_seconds()
+
+            try:
+                stats = json.loads(output.strip().splitlines()[-1])
+            except (ValueError, IndexError):
+                info('*** Could not parse load client output: {}\n'.format(output))
+                continue
+
+            stats['layout'] = layout
+            stats['server_cpu'] = cpu_after - cpu_before
+            stats['server_cpu_per_request'] = (stats['server_cpu'] / stats['requests']
+                                               if stats['requests'] else None)
+            results.append(stats)
+
+    # Stop network
+    info('*** Stopping network\n')
+    net.stop()
+
+    os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+    with open(RESULTS_FILE, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print('{:<10} {:>7} {:>9} {:>10} {:>10} {:>11} {:>7}'.format(
+        'layout', 'clients', 'requests', 'req/s', 'cpu (s)', 'startup (s)', 'errors'))
+    for r in results:
+        print('{:<10} {:>7} {:>9} {:>10.1f} {:>10.2f} {:>11} {:>7}'.format(
+            r['layout'], r['clients'], r['requests'], r['request_rate'], r['server_cpu'],
+            '{:.3f}'.format(r['startup_mean']) if r['startup_mean'] is not None else '-',
+            r['errors']))
+    print('Results saved to {}'.format(RESULTS_FILE))
+
+if __name__ == '__main__':
+    setLogLevel('info')
+
+    try:
+        max_clients = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+        client_bw = float(sys.argv[2]) if len(sys.argv) > 2 else 100
+    except ValueError:
+        print("Usage: sudo python3 benchmark_packaging.py [max_clients] [client_bw]")
+        sys.exit(1)
+
+    benchmarkPackaging(max_clients, client_bw)
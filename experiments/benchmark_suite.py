@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark suite for the analysis and emulation tooling
+
+This script measures the experiment pipeline without Mininet. It generates
+synthetic inputs in a temporary directory:
+- a corpus of result files in the format analyze_results.py reads
+- segment trees for the prepare_video.sh ladder, in both packaging layouts
+
+and times each stage (parsing, aggregation, plotting, manifest and sidx
+parsing, load client sessions over a local HTTP server). Wall time,
+throughput and memory growth of every stage, plus the run's peak memory,
+are appended to a JSON history file. The run fails when a stage or the
+peak regresses by more than the threshold against the median of recent
+comparable runs.
+
+Usage: python3 experiments/benchmark_suite.py [--sessions N] [--clients N]
+                                              [--threshold 0.2] [--history FILE]
+"""
+
+import argparse
+import http.server
+import json
+import os
+import random
+import re
+import resource
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# Plotting must not need a display
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import analyze_results
+import dash_load_client
+
+HISTORY_FILE = 'experiments/results/benchmark_history.json'
+
+# Ladder from setup/prepare_video.sh: (representation id, height, video kbps, audio kbps)
+LADDER = [
+    ('1', 240, 400, 64),
+    ('2', 360, 800, 96),
+    ('3', 480, 1200, 128),
+    ('4', 720, 2500, 192),
+]
+VIDEO_DURATION = 30   # seconds, as trimmed by prepare_video.sh
+SEGMENT_DURATION = 2  # seconds, as passed to mp4box -dash
+
+# Sweep points from run_experiments.sh, used to spread the synthetic corpus
+SWEEP = [('simple', 'bw', p) for p in (10, 5, 2, 1)] + \
+        [('simple', 'loss', p) for p in (0, 1, 5)] + \
+        [('complex', 'default', 0)] + \
+        [('complex', 'loss', p) for p in (1, 5)]
+
+# Stages shorter than this are too noisy to flag as regressions
+MIN_SECONDS = 0.05
+
+# Memory growth below this (in MB) is allocator noise, not a regression
+MIN_GROWTH_MB = 1.0
+
+# Stages that only build benchmark inputs are recorded but never compared
+SETUP_STAGES = ('generate_corpus', 'generate_segments')
+
+def peak_rss_mb():
+    """High-water mark of the process resident memory so far."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_stage(stages, name, func, items=None):
+    """Run func once, recording wall time, throughput and peak memory growth.
+
+    Memory growth is how far the stage raised the process high-water mark
+    (ru_maxrss), so a stage is only charged for memory it pushed past the
+    earlier stages; tracemalloc would be exact but slows plotting down
+    several times.
+    """
+    peak_before = peak_rss_mb()
+    start = time.perf_counter()
+    value = func()
+    seconds = time.perf_counter() - start
+
+    stage = {'seconds': seconds, 'peak_growth_mb': peak_rss_mb() - peak_before}
+    if items is not None:
+        count = items(value) if callable(items) else items
+        stage['items'] = count
+        stage['throughput'] = count / seconds if seconds > 0 else 0.0
+    stages[name] = stage
+    print('{:<28} {:>10.3f} s {:>12} /s {:>+9.1f} MB'.format(
+        name, seconds,
+        '{:.0f}'.format(stage['throughput']) if 'throughput' in stage else '-',
+        stage['peak_growth_mb']))
+    return value
+
+# --- Synthetic inputs ---
+
+def generate_corpus(directory, sessions, seed=0):
+    """Write one result file per session, spread across the experiment sweep."""
+    rng = random.Random(seed)
+    for i in range(sessions):
+        topology, mode, param = SWEEP[i % len(SWEEP)]
+        with open(os.path.join(directory, '{}_{}_{}_{}.txt'.format(topology, mode, param, i)), 'w') as f:
+            f.write('Experiment: Topology={}, Mode={}, Parameter={}\n'.format(topology, mode, param))
+            f.write('Date: Mon Jan 01 00:00:00 UTC 2024\n')
+            f.write('Server IP: 10.0.0.1\n')
+            f.write('Statistics: initial_delay={:.2f},stall_count={},stall_duration={:.2f},'
+                    'quality_changes={},avg_quality={:.2f}\n'.format(
+                        rng.uniform(0.5, 3.0), rng.randint(0, 10), rng.uniform(0, 2.0),
+                        rng.randint(0, 20), rng.uniform(0, 3.0)))
+    return sessions
+
+def segment_sizes(kbps):
+    """Byte sizes of the segments of a constant bitrate stream."""
+    count = VIDEO_DURATION // SEGMENT_DURATION
+    return [kbps * 1000 * SEGMENT_DURATION // 8] * count
+
+def build_sidx(sizes, timescale=1000):
+    """Build a version 0 sidx box referencing subsegments of the given sizes."""
+    body = struct.pack('>I', 0)                              # version 0, flags
+    body += struct.pack('>IIII', 1, timescale, 0, 0)         # reference_ID, timescale, earliest_pt, first_offset
+    body += struct.pack('>HH', 0, len(sizes))                # reserved, reference_count
+    for size in sizes:
+        body += struct.pack('>III', size, SEGMENT_DURATION * timescale, 0x90000000)
+    return struct.pack('>I4s', 8 + len(body), b'sidx') + body
+
+def generate_segments(directory):
+    """Write both prepare_video.sh layouts of the ladder: segments/ and single/."""
+    init = b'\0' * 1024
+    segments_dir = os.path.join(directory, 'segments')
+    single_dir = os.path.join(directory, 'single')
+    os.makedirs(segments_dir)
+    os.makedirs(single_dir)
+
+    mpd_header = ('<?xml version="1.0"?>\n<MPD xmlns="urn:mpeg:dash:schema:mpd:2011" '
+                  'type="static" mediaPresentationDuration="PT{}S">\n<Period>\n'.format(VIDEO_DURATION))
+    mpd_footer = '</Period>\n</MPD>\n'
+    segments_mpd = [mpd_header]
+    single_mpd = [mpd_header]
+    files = 0
+
+    for media in ('video', 'audio'):
+        segments_mpd.append('<AdaptationSet contentType="{}">\n'.format(media))
+        single_mpd.append('<AdaptationSet contentType="{}">\n'.format(media))
+        for rep_id, height, video_kbps, audio_kbps in LADDER:
+            kbps = video_kbps if media == 'video' else audio_kbps
+            rep = '{}_{}'.format(media, rep_id)
+            sizes = segment_sizes(kbps)
+
+            # Multi-file layout: segment_<rep>_N.m4s plus an init segment, SegmentList manifest
+            with open(os.path.join(segments_dir, 'segment_{}_init.mp4'.format(rep)), 'wb') as f:
+                f.write(init)
+            segments_mpd.append('<Representation id="{}" bandwidth="{}">\n<SegmentList>\n'
+                                '<Initialization sourceURL="segment_{}_init.mp4"/>\n'.format(rep, kbps * 1000, rep))
+            for number, size in enumerate(sizes, 1):
+                with open(os.path.join(segments_dir, 'segment_{}_{}.m4s'.format(rep, number)), 'wb') as f:
+                    f.write(b'\0' * size)
+                segments_mpd.append('<SegmentURL media="segment_{}_{}.m4s"/>\n'.format(rep, number))
+            segments_mpd.append('</SegmentList>\n</Representation>\n')
+            files += len(sizes) + 1
+
+            # Single-file layout: init + sidx + media in one file, SegmentBase manifest
+            sidx = build_sidx(sizes)
+            name = 'bbb_30s_{}p_{}_dashinit.mp4'.format(height, media)
+            with open(os.path.join(single_dir, name), 'wb') as f:
+                f.write(init)
+                f.write(sidx)
+                for size in sizes:
+                    f.write(b'\0' * size)
+            single_mpd.append('<Representation id="{}" bandwidth="{}">\n<BaseURL>{}</BaseURL>\n'
+                              '<SegmentBase indexRange="{}-{}"><Initialization range="0-{}"/></SegmentBase>\n'
+                              '</Representation>\n'.format(rep, kbps * 1000, name, len(init),
+                                                          len(init) + len(sidx) - 1, len(init) - 1))
+            files += 1
+        segments_mpd.append('</AdaptationSet>\n')
+        single_mpd.append('</AdaptationSet>\n')
+
+    for layout_dir, parts in ((segments_dir, segments_mpd), (single_dir, single_mpd)):
+        with open(os.path.join(layout_dir, 'manifest.mpd'), 'w') as f:
+            f.write(''.join(parts + [mpd_footer]))
+    return files
+
+class RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    "Static file handler with single byte-range support, standing in for Apache"
+
+    # Keep-alive, like Apache, so the load client can reuse its connection
+    protocol_version = 'HTTP/1.1'
+
+    # Headers and body are separate writes; on a kept-alive connection Nagle
+    # would hold the body back until the client's delayed ACK (Apache sets
+    # TCP_NODELAY too)
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        size = os.path.getsize(path)
+        match = re.match(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+        if match:
+            first = int(match.group(1))
+            last = min(int(match.group(2)) if match.group(2) else size - 1, size - 1)
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes {}-{}/{}'.format(first, last, size))
+        else:
+            first, last = 0, size - 1
+            self.send_response(200)
+        length = last - first + 1
+        self.send_header('Content-Length', str(length))
+        self.end_headers()
+        with open(path, 'rb') as f:
+            f.seek(first)
+            self.wfile.write(f.read(length))
+
+class RangeHTTPServer(http.server.ThreadingHTTPServer):
+    "Threaded server with a listen backlog large enough for all concurrent clients"
+
+    # The socketserver default of 5 drops SYNs and adds 1 s retransmit delays
+    request_queue_size = 128
+
+# --- Stages ---
+
+def plot_all(groups, output_dir):
+    """Generate every graph analyze_results.py would, into output_dir."""
+    analyze_results.OUTPUT_DIR = output_dir
+    simple_bw_results, simple_loss_results, complex_results = groups
+    if simple_bw_results:
+        analyze_results.generate_bandwidth_graphs(simple_bw_results)
+    if simple_loss_results:
+        analyze_results.generate_loss_graphs(simple_loss_results)
+    if complex_results:
+        analyze_results.generate_complex_graphs(complex_results)
+
+def parse_manifests(paths, repeat):
+    """Build download plans for each manifest, repeat times."""
+    texts = []
+    for path in paths:
+        with open(path) as f:
+            texts.append((f.read(), 'http://localhost/' + os.path.basename(os.path.dirname(path)) + '/manifest.mpd'))
+    for _ in range(repeat):
+        for text, url in texts:
+            dash_load_client.parse_manifest(text, url)
+    return repeat * len(texts)
+
+def parse_indexes(single_dir, repeat):
+    """Parse every sidx box of the single-file layout, repeat times."""
+    with open(os.path.join(single_dir, 'manifest.mpd')) as f:
+        text = f.read()
+
+    # Read each representation's index once; parsing is what is timed
+    indexes = []
+    for match in re.finditer(r'<BaseURL>(.+?)</BaseURL>\n<SegmentBase indexRange="(\d+)-(\d+)"', text):
+        first, last = int(match.group(2)), int(match.group(3))
+        with open(os.path.join(single_dir, match.group(1)), 'rb') as f:
+            f.seek(first)
+            indexes.append((f.read(last - first + 1), (first, last)))
+    for _ in range(repeat):
+        for data, index_range in indexes:
+            dash_load_client.parse_sidx(data, index_range)
+    return repeat * len(indexes)
+
+# --- History and regression checks ---
+
+def git_commit():
+    """Current commit, if the suite runs from a git checkout."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, universal_newlines=True).stdout.strip() or None
+    except OSError:
+        return None
+
+def find_regressions(run, history, threshold, window):
+    """Compare a run against the median of the last comparable runs."""
+    previous = [r for r in history if r['config'] == run['config']][-window:]
+    if not previous:
+        return []
+
+    def median(values):
+        values = sorted(values)
+        middle = len(values) // 2
+        return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+    def check(name, metric, value, baseline, higher_is_better):
+        if baseline <= 0:
+            return
+        change = (value - baseline) / baseline
+        if (-change if higher_is_better else change) > threshold:
+            regressions.append('{} {}: {:.4g} vs baseline {:.4g} ({:+.0%})'.format(
+                name, metric, value, baseline, change))
+
+    regressions = []
+
+    # The process peak is compared once per run, not once per stage
+    peaks = [r['peak_mb'] for r in previous if 'peak_mb' in r]
+    if peaks:
+        check('run', 'peak_mb', run['peak_mb'], median(peaks), False)
+
+    for name, stage in run['stages'].items():
+        if name in SETUP_STAGES:
+            continue
+        baselines = [r['stages'][name] for r in previous if name in r['stages']]
+        if not baselines:
+            continue
+
+        # Throughput is items / seconds, so compare one or the other, never both:
+        # throughput where the stage counts items, wall time where it does not
+        speed = ('throughput', True) if 'throughput' in stage else ('seconds', False)
+
+        # (metric, higher is better)
+        for metric, higher_is_better in (speed, ('peak_growth_mb', False)):
+            values = [b[metric] for b in baselines if metric in b]
+            if metric not in stage or not values:
+                continue
+            baseline = median(values)
+            if metric in ('seconds', 'throughput') and median([b['seconds'] for b in baselines]) < MIN_SECONDS:
+                continue
+            if metric == 'peak_growth_mb' and baseline < MIN_GROWTH_MB:
+                continue
+            check(name, metric, stage[metric], baseline, higher_is_better)
+    return regressions
+
+def run_suite(sessions, clients, repeat, plot, work_dir):
+    """Run every stage and return the per-stage measurements."""
+    stages = {}
+
+    corpus_dir = os.path.join(work_dir, 'results')
+    os.makedirs(corpus_dir)
+    run_stage(stages, 'generate_corpus', lambda: generate_corpus(corpus_dir, sessions), items=sessions)
+
+    # Analysis pipeline
+    _, results = run_stage(stages, 'parse_results',
+                           lambda: analyze_results.load_results(corpus_dir),
+                           items=lambda value: len(value[1]))
+    groups = run_stage(stages, 'aggregate_results', lambda: analyze_results.group_results(results),
+                       items=len(results))
+    if plot:
+        graphs_dir = os.path.join(work_dir, 'graphs')
+        os.makedirs(graphs_dir)
+        run_stage(stages, 'plot_results', lambda: plot_all(groups, graphs_dir), items=len(results))
+    del results, groups
+
+    # Client tooling
+    media_dir = os.path.join(work_dir, 'media')
+    run_stage(stages, 'generate_segments', lambda: generate_segments(media_dir), items=lambda files: files)
+    manifests = [os.path.join(media_dir, layout, 'manifest.mpd') for layout in ('segments', 'single')]
+    run_stage(stages, 'parse_manifests', lambda: parse_manifests(manifests, repeat), items=lambda n: n)
+    run_stage(stages, 'parse_sidx', lambda: parse_indexes(os.path.join(media_dir, 'single'), repeat),
+              items=lambda n: n)
+
+    handler = lambda *args, **kwargs: RangeRequestHandler(*args, directory=media_dir, **kwargs)
+    server = RangeHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        for layout in ('segments', 'single'):
+            url = 'http://127.0.0.1:{}/{}/manifest.mpd'.format(server.server_address[1], layout)
+            summary = run_stage(stages, 'client_sessions_' + layout,
+                                lambda: dash_load_client.run_clients(url, clients),
+                                items=lambda s: s['requests'])
+            if summary['errors']:
+                raise RuntimeError('{} load client sessions failed'.format(summary['errors']))
+            stages['client_sessions_' + layout]['startup_mean'] = summary['startup_mean']
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    return stages
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the analysis and emulation tooling without Mininet')
+    parser.add_argument('--sessions', type=int, default=10000, help='synthetic result files to analyze')
+    parser.add_argument('--clients', type=int, default=8, help='concurrent load client sessions per layout')
+    parser.add_argument('--repeat', type=int, default=1000, help='iterations of the manifest and sidx parsers')
+    parser.add_argument('--no-plot', dest='plot', action='store_false', help='skip the plotting stage')
+    parser.add_argument('--history', default=HISTORY_FILE, help='JSON history file')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative regression (0.2 = 20%%)')
+    parser.add_argument('--window', type=int, default=5, help='comparable past runs used as baseline')
+    parser.add_argument('--no-record', dest='record', action='store_false',
+                        help='compare against history without appending this run')
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix='sdn_benchmark_')
+    try:
+        stages = run_suite(args.sessions, args.clients, args.repeat, args.plot, work_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    run = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': git_commit(),
+        'python': sys.version.split()[0],
+        'config': {'sessions': args.sessions, 'clients': args.clients,
+                   'repeat': args.repeat, 'plot': args.plot},
+        'peak_mb': peak_rss_mb(),
+        'stages': stages,
+    }
+
+    history = []
+    if os.path.exists(args.history):
+        with open(args.history) as f:
+            history = json.load(f)
+
+    regressions = find_regressions(run, history, args.threshold, args.window)
+
+    if args.record:
+        os.makedirs(os.path.dirname(args.history) or '.', exist_ok=True)
+        history.append(run)
+        with open(args.history, 'w') as f:
+            json.dump(history, f, indent=2)
+        print('Run recorded in {}'.format(args.history))
+
+    if regressions:
+        print('Performance regressions (threshold {:.0%}):'.format(args.threshold))
+        for regression in regressions:
+            print('  ' + regression)
+        sys.exit(1)
+
+    print('No regressions against the last {} comparable runs'.format(args.window))
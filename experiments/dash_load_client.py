@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+
+"""
+Lightweight DASH load client for packaging experiments
+
+This script emulates N concurrent DASH clients without a browser. Each client
+downloads the manifest, the initialization data and every media segment of one
+representation per adaptation set. It understands both layouts produced by
+setup/prepare_video.sh:
+- segments: SegmentList/SegmentTemplate with one file per segment
+- single:   SegmentBase with a sidx index, fetched with HTTP Range requests
+
+Usage: python3 dash_load_client.py <manifest_url> [clients] [lowest|highest]
+"""
+
+import http.client
+import json
+import re
+import struct
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from urllib.parse import urljoin, urlsplit
+
+# Namespace used by MP4Box and ffmpeg generated manifests
+MPD_NS = {'mpd': 'urn:mpeg:dash:schema:mpd:2011'}
+
+# Number of media segments per adaptation set needed before playback can start
+STARTUP_SEGMENTS = 1
+
+def parse_duration(value):
+    """Convert an ISO 8601 duration (e.g. PT30.000S) to seconds."""
+    match = re.match(r'P(?:(\d+)D)?T?(?:(\d+)H)?(?:(\d+)M)?(?:([\d.]+)S)?', value or '')
+    if not match:
+        return 0.0
+    days, hours, minutes, seconds = (float(g) if g else 0.0 for g in match.groups())
+    return days * 86400 + hours * 3600 + minutes * 60 + seconds
+
+def parse_byte_range(value):
+    """Convert an MPD byte range "first-last" to a (first, last) tuple."""
+    first, last = value.split('-')
+    return int(first), int(last)
+
+def find_inherited(elements, tag):
+    """Return the first child with the given tag, searching from the innermost element."""
+    for element in elements:
+        child = element.find('mpd:' + tag, MPD_NS)
+        if child is not None:
+            return child
+    return None
+
+def resolve_base_url(base, elements):
+    """Apply BaseURL elements from the outermost to the innermost element."""
+    for element in elements:
+        child = element.find('mpd:BaseURL', MPD_NS)
+        if child is not None and child.text:
+            base = urljoin(base, child.text.strip())
+    return base
+
+def expand_template(template, rep_id, bandwidth, number=None):
+    """Substitute $RepresentationID$, $Bandwidth$ and $Number$ identifiers."""
+    def substitute(match):
+        name, fmt = match.group(1), match.group(2)
+        if name == 'RepresentationID':
+            return rep_id
+        value = bandwidth if name == 'Bandwidth' else number
+        return ('%' + fmt[1:]) % value if fmt else str(value)
+
+    result = re.sub(r'\$(RepresentationID|Bandwidth|Number)(%0\d+d)?\$', substitute, template)
+    return result.replace('$$', '$')
+
+def parse_manifest(mpd_text, manifest_url, choice='lowest'):
+    """Build a download plan for one representation per adaptation set.
+
+    Each track in the returned list is a dict with the chosen representation,
+    its initialization request and either a list of media requests
+    (multi-file layouts) or the index request (SegmentBase layout). A request
+    is a (url, byte_range) tuple where byte_range is None for whole files.
+    """
+    root = ET.fromstring(mpd_text)
+    total_duration = parse_duration(root.get('mediaPresentationDuration'))
+    period = root.find('mpd:Period', MPD_NS)
+    if period is None:
+        raise ValueError('Manifest has no Period')
+
+    tracks = []
+    for adaptation_set in period.findall('mpd:AdaptationSet', MPD_NS):
+        representations = adaptation_set.findall('mpd:Representation', MPD_NS)
+        if not representations:
+            continue
+        representations.sort(key=lambda r: int(r.get('bandwidth', 0)))
+        rep = representations[0] if choice == 'lowest' else representations[-1]
+        rep_id = rep.get('id', '')
+        bandwidth = int(rep.get('bandwidth', 0))
+
+        # Segment information may be declared on any level, innermost wins
+        inner_first = [rep, adaptation_set, period]
+        base = resolve_base_url(manifest_url, [root, period, adaptation_set, rep])
+        track = {
+            'representation': rep_id,
+            'bandwidth': bandwidth,
+            'init': None,
+            'index': None,
+            'media': [],
+        }
+
+        segment_base = find_inherited(inner_first, 'SegmentBase')
+        segment_list = find_inherited(inner_first, 'SegmentList')
+        segment_template = find_inherited(inner_first, 'SegmentTemplate')
+
+        if segment_list is not None:
+            init = segment_list.find('mpd:Initialization', MPD_NS)
+            if init is not None:
+                init_range = init.get('range')
+                track['init'] = (urljoin(base, init.get('sourceURL', '')),
+                                 parse_byte_range(init_range) if init_range else None)
+            for segment_url in segment_list.findall('mpd:SegmentURL', MPD_NS):
+                media_range = segment_url.get('mediaRange')
+                track['media'].append((urljoin(base, segment_url.get('media', '')),
+                                       parse_byte_range(media_range) if media_range else None))
+        elif segment_template is not None:
+            initialization = segment_template.get('initialization')
+            if initialization:
+                track['init'] = (urljoin(base, expand_template(initialization, rep_id, bandwidth)), None)
+            timescale = int(segment_template.get('timescale', 1))
+            start_number = int(segment_template.get('startNumber', 1))
+            timeline = segment_template.find('mpd:SegmentTimeline', MPD_NS)
+            if timeline is not None:
+                count = sum(int(s.get('r', 0)) + 1 for s in timeline.findall('mpd:S', MPD_NS))
+            else:
+                segment_duration = int(segment_template.get('duration', 0)) / timescale
+                count = int(-(-total_duration // segment_duration)) if segment_duration else 0
+            media = segment_template.get('media', '')
+            for number in range(start_number, start_number + count):
+                track['media'].append((urljoin(base, expand_template(media, rep_id, bandwidth, number)), None))
+        elif segment_base is not None:
+            index_range = parse_byte_range(segment_base.get('indexRange'))
+            init = segment_base.find('mpd:Initialization', MPD_NS)
+            if init is not None and init.get('range'):
+                init_range = parse_byte_range(init.get('range'))
+            else:
+                init_range = (0, index_range[0] - 1)
+            track['init'] = (base, init_range)
+            track['index'] = (base, index_range)
+        else:
+            raise ValueError('Representation {} has no segment information'.format(rep_id))
+
+        tracks.append(track)
+
+    return tracks
+
+def parse_sidx(data, index_range):
+    """Parse a sidx box and return the byte range of each referenced subsegment."""
+    size, box_type = struct.unpack('>I4s', data[:8])
+    if box_type != b'sidx':
+        raise ValueError('Expected sidx box, got {!r}'.format(box_type))
+    version = data[8]
+    offset = 12
+    offset += 8  # reference_ID, timescale
+    if version == 0:
+        _, first_offset = struct.unpack('>II', data[offset:offset + 8])
+        offset += 8
+    else:
+        _, first_offset = struct.unpack('>QQ', data[offset:offset + 16])
+        offset += 16
+    offset += 2  # reserved
+    reference_count = struct.unpack('>H', data[offset:offset + 2])[0]
+    offset += 2
+
+    # Offsets are relative to the first byte after the sidx box
+    position = index_range[0] + size + first_offset
+    ranges = []
+    for _ in range(reference_count):
+        reference = struct.unpack('>I', data[offset:offset + 4])[0]
+        offset += 12
+        referenced_size = reference & 0x7FFFFFFF
+        ranges.append((position, position + referenced_size - 1))
+        position += referenced_size
+    return ranges
+
+def fetch(connections, url, byte_range=None):
+    """Download a whole file or a byte range of it over a kept-alive connection.
+
+    connections maps "scheme://host:port" to an open HTTP connection so that a
+    session reuses one connection per server, as a player does; urllib would
+    send "Connection: close" and pay a new TCP connection per request.
+    """
+    parts = urlsplit(url)
+    key = '{}://{}'.format(parts.scheme, parts.netloc)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    headers = {}
+    if byte_range is not None:
+        headers['Range'] = 'bytes={}-{}'.format(*byte_range)
+
+    for attempt in range(2):
+        conn = connections.get(key)
+        if conn is None:
+            cls = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+            conn = connections[key] = cls(parts.netloc, timeout=30)
+        try:
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+            break
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server closed an idle keep-alive connection; reconnect once
+            conn.close()
+            del connections[key]
+            if attempt:
+                raise
+
+    if response.status not in (200, 206):
+        raise IOError('HTTP {} for {}'.format(response.status, url))
+    return data
+
+def run_session(manifest_url, choice, result):
+    """Play through the manifest once, recording requests, bytes and startup time."""
+    start = time.time()
+    requests = 0
+    total_bytes = 0
+    connections = {}
+    try:
+        mpd_text = fetch(connections, manifest_url)
+        requests += 1
+        total_bytes += len(mpd_text)
+        tracks = parse_manifest(mpd_text, manifest_url, choice)
+
+        # Initialization (and index) data is fetched for every track before any media
+        for track in tracks:
+            if track['init'] is not None:
+                total_bytes += len(fetch(connections, *track['init']))
+                requests += 1
+            if track['index'] is not None:
+                data = fetch(connections, *track['index'])
+                requests += 1
+                total_bytes += len(data)
+                track['media'] = [(track['index'][0], r) for r in parse_sidx(data, track['index'][1])]
+
+        # Interleave tracks segment by segment, as a player filling both buffers would
+        longest = max((len(track['media']) for track in tracks), default=0)
+        for number in range(longest):
+            for track in tracks:
+                if number < len(track['media']):
+                    total_bytes += len(fetch(connections, *track['media'][number]))
+                    requests += 1
+            if number + 1 == STARTUP_SEGMENTS:
+                result['startup_time'] = time.time() - start
+    except Exception as e:
+        result['error'] = str(e)
+    finally:
+        for conn in connections.values():
+            conn.close()
+
+    result['requests'] = requests
+    result['bytes'] = total_bytes
+    result['duration'] = time.time() - start
+
+def run_clients(manifest_url, clients=1, choice='lowest'):
+    """Run concurrent sessions and return aggregate statistics."""
+    results = [{} for _ in range(clients)]
+    threads = [threading.Thread(target=run_session, args=(manifest_url, choice, results[i]))
+               for i in range(clients)]
+
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_time = time.time() - start
+
+    startup_times = sorted(r['startup_time'] for r in results if 'startup_time' in r)
+    total_requests = sum(r['requests'] for r in results)
+    return {
+        'manifest': manifest_url,
+        'clients': clients,
+        'representation': choice,
+        'errors': sum(1 for r in results if 'error' in r),
+        'requests': total_requests,
+        'bytes': sum(r['bytes'] for r in results),
+        'wall_time': wall_time,
+        'request_rate': total_requests / wall_time if wall_time > 0 else 0.0,
+        'startup_mean': sum(startup_times) / len(startup_times) if startup_times else None,
+        'startup_p50': startup_times[len(startup_times) // 2] if startup_times else None,
+        'startup_p95': startup_times[int(len(startup_times) * 0.95)] if startup_times else None,
+    }
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 dash_load_client.py <manifest_url> [clients] [lowest|highest]")
+        sys.exit(1)
+
+    try:
+        clients = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    except ValueError:
+        print("Number of clients must be an integer")
+        sys.exit(1)
+    choice = sys.argv[3] if len(sys.argv) > 3 else 'lowest'
+
+    # A single JSON line so callers running us inside a Mininet host can parse it
+    print(json.dumps(run_clients(sys.argv[1], clients, choice)))
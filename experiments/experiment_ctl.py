@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+"""
+Command line client for the experiment daemon
+
+Sends one job to experiment_daemon.py and prints each response line as it
+arrives. Arguments after the command are key=value pairs; numeric values are
+sent as numbers.
+
+Examples:
+  python3 experiment_ctl.py status
+  python3 experiment_ctl.py set_link host=h2 bw=2 loss=1
+  python3 experiment_ctl.py start_clients host=h2 clients=4
+  python3 experiment_ctl.py collect mode=bw param=2
+  python3 experiment_ctl.py reset
+
+Set SDN_EXPERIMENT_SOCKET to use a socket other than /tmp/sdn_experiment.sock.
+"""
+
+import json
+import os
+import socket
+import sys
+
+SOCKET_PATH = os.environ.get('SDN_EXPERIMENT_SOCKET', '/tmp/sdn_experiment.sock')
+
+def parse_value(value):
+    """Send numbers as numbers so the daemon can pass them straight to Mininet."""
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+def send_job(job, socket_path=SOCKET_PATH):
+    """Send a job and yield each response message until the final status."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(socket_path)
+        with conn.makefile('rw') as stream:
+            stream.write(json.dumps(job) + '\n')
+            stream.flush()
+            for line in stream:
+                message = json.loads(line)
+                yield message
+                if 'status' in message:
+                    return
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 experiment_ctl.py <command> [key=value ...]")
+        sys.exit(1)
+
+    job = {'cmd': sys.argv[1]}
+    for arg in sys.argv[2:]:
+        key, _, value = arg.partition('=')
+        job[key] = parse_value(value)
+
+    status = 'error'
+    for message in send_job(job):
+        print(json.dumps(message))
+        status = message.get('status', status)
+
+    sys.exit(0 if status == 'ok' else 1)
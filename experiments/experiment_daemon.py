@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+
+"""
+Long-lived experiment daemon for adaptive video streaming with SDN
+
+This script builds the simple or complex topology once, connects it to the
+OpenDaylight controller, starts Apache on the server host and then keeps the
+network warm while accepting jobs on a local Unix socket. Each sweep point
+becomes a few cheap jobs instead of a full Mininet start/stop cycle.
+
+Jobs are single JSON lines; the daemon answers with one or more JSON lines
+and always finishes with a line containing "status" ("ok" or "error"):
+  {"cmd": "status"}
+  {"cmd": "set_link", "host": "h2", "bw": 5, "loss": 1, "delay": "10ms"}
+  {"cmd": "start_clients", "host": "h2", "clients": 4, "manifest": "/videos/dash/manifest.mpd"}
+  {"cmd": "collect", "topology": "simple", "mode": "bw", "param": 5}
+  {"cmd": "reset"}
+  {"cmd": "shutdown"}
+
+Use experiment_ctl.py to send jobs from the shell.
+
+Usage: sudo python3 experiment_daemon.py [simple|complex] [socket_path]
+"""
+
+from mininet.net import Mininet
+from mininet.node import RemoteController, CPULimitedHost, Host, OVSKernelSwitch
+from mininet.log import setLogLevel, info
+from mininet.link import TCLink
+from server_stats import apache_cpu_seconds
+import json
+import os
+import socket
+import sys
+import time
+
+SOCKET_PATH = '/tmp/sdn_experiment.sock'
+RESULTS_DIR = 'experiments/results'
+LOAD_CLIENT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dash_load_client.py')
+
+# Link parameters applied at start-up and restored by "reset"
+TOPOLOGIES = {
+    'simple': {
+        'switches': ['s1'],
+        'links': [('h1', 's1', {'bw': 10}),
+                  ('h2', 's1', {'bw': 5})],
+    },
+    'complex': {
+        'switches': ['s1', 's2', 's3'],
+        'links': [('h1', 's1', {'bw': 100}),
+                  ('s1', 's2', {'bw': 50}),
+                  ('s1', 's3', {'bw': 50}),
+                  ('s2', 'h2', {'bw': 10}),
+                  ('s2', 'h3', {'bw': 5}),
+                  ('s3', 'h4', {'bw': 2})],
+    },
+}
+
+class ExperimentDaemon(object):
+    "Keeps one Mininet network running and executes jobs against it"
+
+    def __init__(self, topology='simple'):
+        self.topology = topology
+        self.net = None
+        self.link_params = {}
+        self.runs = []
+        self.shutdown_requested = False
+
+    def start(self):
+        "Build the network, attach the controller and start the origin server once"
+        config = TOPOLOGIES[self.topology]
+
+        # Create network with remote controller (OpenDaylight)
+        info('*** Creating {} network with remote controller\n'.format(self.topology))
+        controller_ip = '127.0.0.1'  # Change this to the IP of your OpenDaylight controller
+
+        self.net = Mininet(topo=None,
+                           build=False,
+                           host=CPULimitedHost,
+                           link=TCLink,
+                           ipBase='10.0.0.0/8')
+
+        # Add remote controller
+        info('*** Adding controller\n')
+        c0 = self.net.addController(name='c0',
+                                    controller=RemoteController,
+                                    ip=controller_ip,
+                                    protocol='tcp',
+                                    port=6653)
+
+        # Add switches and hosts; h1 is always the server
+        info('*** Adding switches and hosts\n')
+        for name in config['switches']:
+            self.net.addSwitch(name, cls=OVSKernelSwitch)
+        hosts = sorted({n for a, b, _ in config['links'] for n in (a, b) if n.startswith('h')})
+        for name in hosts:
+            self.net.addHost(name, cls=Host, ip='10.0.0.{}'.format(name[1:]), defaultRoute=None)
+
+        info('*** Adding links\n')
+        for a, b, params in config['links']:
+            self.net.addLink(a, b, cls=TCLink, **params)
+
+        # Build network
+        info('*** Starting network\n')
+        self.net.build()
+        for controller in self.net.controllers:
+            controller.start()
+        for name in config['switches']:
+            self.net.get(name).start([c0])
+
+        # Configure Apache on the server host
+        info('*** Configuring server\n')
+        server = self.net.get('h1')
+        server.cmd('service apache2 stop || true')  # Stop any existing Apache service, ignoring errors
+        server.cmd('apache2 -k start || true')      # Start Apache in the server namespace, ignoring errors
+
+        self.reset_links()
+        info('*** Server IP: {}\n'.format(server.IP()))
+
+    def stop(self):
+        "Stop Apache and the network"
+        if self.net is not None:
+            info('*** Stopping network\n')
+            self.net.get('h1').cmd('apache2 -k stop || true')
+            self.net.stop()
+            self.net = None
+
+    def host_link(self, host_name):
+        "Return the link attaching a host to its switch"
+        # Look the link up by its ends; a switch's defaultIntf() is lo, not a link
+        if host_name.startswith('h'):
+            for a, b, _ in TOPOLOGIES[self.topology]['links']:
+                if host_name in (a, b):
+                    switch_name = b if a == host_name else a
+                    return self.net.linksBetween(self.net.get(host_name), self.net.get(switch_name))[0]
+        raise ValueError('No host link for {}'.format(host_name))
+
+    def reset_links(self):
+        "Restore the link parameters the topology was built with"
+        self.link_params = {}
+        for a, b, params in TOPOLOGIES[self.topology]['links']:
+            # Switch-to-switch links are never changed by jobs
+            if not (a.startswith('h') or b.startswith('h')):
+                continue
+            host = a if a.startswith('h') else b
+            self.apply_link(host, dict(params))
+
+    def apply_link(self, host_name, params):
+        "Reconfigure tc on both ends of a host link"
+        # TCIntf.config() resets anything not passed, so always apply the full set
+        link = self.host_link(host_name)
+        link.intf1.config(**params)
+        link.intf2.config(**params)
+        self.link_params[host_name] = params
+
+    # --- Jobs ---
+
+    def job_status(self, job, send):
+        send({'topology': self.topology,
+              'server_ip': self.net.get('h1').IP(),
+              'hosts': {h.name: h.IP() for h in self.net.hosts},
+              'links': self.link_params,
+              'runs': len(self.runs)})
+
+    def job_set_link(self, job, send):
+        host = job['host']
+        params = dict(self.link_params.get(host, {}))
+        for key in ('bw', 'delay', 'jitter', 'loss', 'max_queue_size'):
+            if key in job:
+                params[key] = job[key]
+        self.apply_link(host, params)
+        send({'host': host, 'link': params})
+
+    def job_start_clients(self, job, send):
+        host = self.net.get(job.get('host', 'h2'))
+        url = 'http://{}{}'.format(self.net.get('h1').IP(),
+                                   job.get('manifest', '/videos/dash/manifest.mpd'))
+        clients = int(job.get('clients', 1))
+        send({'event': 'started', 'host': host.name, 'clients': clients, 'url': url})
+
+        cpu_before = apache_cpu_seconds()
+        process = host.popen(['python3', LOAD_CLIENT, url, str(clients),
+                              job.get('representation', 'lowest')],
+                             universal_newlines=True)
+        output, _ = process.communicate()
+        stats = json.loads(output.strip().splitlines()[-1])
+        stats['host'] = host.name
+        stats['server_cpu'] = apache_cpu_seconds() - cpu_before
+        stats['link'] = self.link_params.get(host.name, {})
+        self.runs.append(stats)
+        send({'event': 'result', 'stats': stats})
+
+    def job_collect(self, job, send):
+        "Summarise runs since the last reset, optionally as a result file for analyze_results.py"
+        startup = [r['startup_mean'] for r in self.runs if r['startup_mean'] is not None]
+        summary = {
+            'runs': len(self.runs),
+            'requests': sum(r['requests'] for r in self.runs),
+            'errors': sum(r['errors'] for r in self.runs),
+            'server_cpu': sum(r['server_cpu'] for r in self.runs),
+            'initial_delay': sum(startup) / len(startup) if startup else 0.0,
+        }
+
+        if 'mode' in job:
+            topology = job.get('topology', self.topology)
+            result_file = os.path.join(RESULTS_DIR, '{}_{}_{}.txt'.format(
+                topology, job['mode'], job.get('param', 0)))
+            os.makedirs(RESULTS_DIR, exist_ok=True)
+            with open(result_file, 'w') as f:
+                f.write('Experiment: Topology={}, Mode={}, Parameter={}\n'.format(
+                    topology, job['mode'], job.get('param', 0)))
+                f.write('Date: {}\n'.format(time.strftime('%a %b %d %H:%M:%S %Z %Y')))
+                f.write('Server IP: {}\n'.format(self.net.get('h1').IP()))
+                f.write('Statistics: initial_delay={:.2f},requests={},errors={},server_cpu={:.2f}\n'.format(
+                    summary['initial_delay'], summary['requests'], summary['errors'], summary['server_cpu']))
+            summary['result_file'] = result_file
+
+        send({'event': 'summary', 'summary': summary, 'runs': self.runs})
+
+    def job_reset(self, job, send):
+        self.runs = []
+        self.reset_links()
+        send({'links': self.link_params})
+
+    def handle(self, job, send):
+        "Dispatch one job"
+        cmd = job.get('cmd')
+        if cmd == 'shutdown':
+            # Set before replying so a vanished client cannot cancel the shutdown
+            self.shutdown_requested = True
+            send({'status': 'ok'})
+            return
+
+        handler = getattr(self, 'job_' + str(cmd), None)
+        if handler is None:
+            send({'status': 'error', 'error': 'Unknown command: {}'.format(cmd)})
+            return
+
+        try:
+            handler(job, send)
+            send({'status': 'ok'})
+        except ConnectionError:
+            # The client went away; there is nobody to report the error to
+            raise
+        except Exception as e:
+            send({'status': 'error', 'error': str(e)})
+
+    def serve_connection(self, conn):
+        "Run the jobs sent on one connection until it closes or a shutdown job"
+        with conn, conn.makefile('rw') as stream:
+            def send(message):
+                stream.write(json.dumps(message) + '\n')
+                stream.flush()
+
+            for line in stream:
+                if not line.strip():
+                    continue
+                try:
+                    job = json.loads(line)
+                except ValueError:
+                    send({'status': 'error', 'error': 'Invalid JSON'})
+                    continue
+                if not isinstance(job, dict):
+                    send({'status': 'error', 'error': 'Job must be a JSON object'})
+                    continue
+                info('*** Job: {}\n'.format(job.get('cmd')))
+                self.handle(job, send)
+                if self.shutdown_requested:
+                    break
+
+    def serve(self, socket_path=SOCKET_PATH):
+        "Accept jobs one at a time; Mininet is not safe to drive from several threads"
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(1)
+        info('*** Waiting for jobs on {}\n'.format(socket_path))
+
+        try:
+            while not self.shutdown_requested:
+                conn, _ = server.accept()
+                try:
+                    self.serve_connection(conn)
+                except OSError as e:
+                    # A client disconnecting mid-job must not take the network down
+                    info('*** Client disconnected: {}\n'.format(e))
+                except Exception as e:
+                    # Nor may anything else a single connection triggers
+                    info('*** Dropped connection after error: {!r}\n'.format(e))
+        finally:
+            server.close()
+            os.unlink(socket_path)
+
+if __name__ == '__main__':
+    setLogLevel('info')
+
+    topology = sys.argv[1] if len(sys.argv) > 1 else 'simple'
+    if topology not in TOPOLOGIES:
+        print("Usage: sudo python3 experiment_daemon.py [simple|complex] [socket_path]")
+        sys.exit(1)
+    socket_path = sys.argv[2] if len(sys.argv) > 2 else SOCKET_PATH
+
+    daemon = ExperimentDaemon(topology)
+    try:
+        daemon.start()
+        daemon.serve(socket_path)
+    finally:
+        daemon.stop()
@@ -0,0 +1,87 @@
+#!/bin/bash
+
+# Script to run the experiment sweep against a warm network kept by experiment_daemon.py
+# Instead of starting Mininet, Apache and the controller connection for every sweep
+# point, each topology is built once and every point only changes link parameters.
+echo "Running adaptive video streaming experiments (daemon mode)..."
+
+SOCKET="/tmp/sdn_experiment.sock"
+CLIENTS=${CLIENTS:-1}
+CTL="python3 experiments/experiment_ctl.py"
+export SDN_EXPERIMENT_SOCKET="$SOCKET"
+
+# Create results directory if it doesn't exist
+mkdir -p experiments/results
+
+# Start the daemon for a topology and wait until it accepts jobs
+start_daemon() {
+    topology=$1
+    echo "Starting experiment daemon for ${topology} topology..."
+    sudo python3 experiments/experiment_daemon.py "$topology" "$SOCKET" &
+    daemon_pid=$!
+
+    for _ in $(seq 1 60); do
+        if sudo $CTL status > /dev/null 2>&1; then
+            return 0
+        fi
+        sleep 1
+    done
+
+    echo "Error: experiment daemon did not start"
+    sudo kill $daemon_pid
+    exit 1
+}
+
+stop_daemon() {
+    sudo $CTL shutdown > /dev/null
+    wait $daemon_pid
+}
+
+# Function to run a single sweep point on the warm network
+run_point() {
+    topology=$1
+    mode=$2
+    param=$3
+    shift 3
+
+    echo "Running experiment: Topology=${topology}, Mode=${mode}, Parameter=${param}"
+    sudo $CTL reset > /dev/null
+    for link in "$@"; do
+        sudo $CTL set_link $link > /dev/null
+    done
+    sudo $CTL start_clients host=h2 clients=$CLIENTS
+    sudo $CTL collect topology=$topology mode=$mode param=$param | tail -n 2 | head -n 1
+}
+
+# Simple topology experiments
+start_daemon "simple"
+
+echo "Running bandwidth experiments..."
+for bw in 10 5 2 1; do
+    run_point "simple" "bw" "$bw" "host=h2 bw=$bw"
+done
+
+echo "Running packet loss experiments..."
+for loss in 0 1 5; do
+    run_point "simple" "loss" "$loss" "host=h2 loss=$loss"
+done
+
+stop_daemon
+
+# Complex topology experiments
+start_daemon "complex"
+
+run_point "complex" "default" "0"
+for loss in 1 5; do
+    run_point "complex" "loss" "$loss" "host=h2 loss=$loss" "host=h3 loss=$loss" "host=h4 loss=$loss"
+done
+
+stop_daemon
+sudo mn -c
+
+echo "All experiments completed!"
+echo "Results are available in the experiments/results directory."
+
+# Analyze the results
+echo "Analyzing results..."
+python3 experiments/analyze_results.py
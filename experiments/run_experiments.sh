@@ -1,6 +1,7 @@
 #!/bin/bash
 
 # Script to run experiments with different network conditions
+# See run_daemon_experiments.sh for a faster sweep that keeps the network running
 echo "Running adaptive video streaming experiments..."
 
 # Create results directory if it doesn't exist
@@ -38,8 +39,8 @@ run_experiment() {
     # Wait for the topology to initialize
     sleep 10
     
-    # Get the server IP (h1)
-    server_ip=$(sudo mn -c && sudo python3 -c "from mininet.net import Mininet; from mininet.node import Controller, RemoteController; from mininet.cli import CLI; from mininet.log import setLogLevel; setLogLevel('info'); net = Mininet(); h1 = net.addHost('h1'); print(h1.IP())")
+    # The server (h1) has a fixed address in both topologies
+    server_ip="10.0.0.1"
     
     # Start Firefox on client (h2) and access the DASH player
     sudo mn -x h2 firefox http://${server_ip}/dash/index.html &
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+"""
+Origin server statistics for adaptive video streaming experiments
+
+Helpers shared by the experiment scripts to measure the Apache server
+running on the server host. Mininet hosts share the root PID namespace, so
+these can be called from the script that drives the network.
+"""
+
+import os
+import subprocess
+
+def apache_cpu_seconds():
+    """Return the user+system CPU time consumed so far by all apache2 processes."""
+    ticks = os.sysconf('SC_CLK_TCK')
+    pids = subprocess.run(['pgrep', '-x', 'apache2'], stdout=subprocess.PIPE,
+                          universal_newlines=True).stdout.split()
+    total = 0
+    for pid in pids:
+        try:
+            with open('/proc/{}/stat'.format(pid)) as f:
+                # Fields after the command name; utime, stime, cutime, cstime are 14-17
+                fields = f.read().rsplit(')', 1)[1].split()
+            total += sum(int(v) for v in fields[11:15])
+        except (OSError, IndexError):
+            # Worker exited between pgrep and the read
+            continue
+    return total / ticks
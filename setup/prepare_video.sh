@@ -2,12 +2,20 @@
 
 # Script to download Big Buck Bunny, trim it, create multiple representations, 
 # segment it for DASH, and place it in the web server directory.
+#
+# Usage: bash setup/prepare_video.sh [segments|single]
+#   segments - one segment_<rep>_N.m4s file per 2 s segment (default)
+#   single   - one indexed file per representation (SegmentBase + sidx),
+#              fetched by the player with HTTP Range requests
+# Set OUTPUT_DIR to deploy somewhere else, e.g. to keep both layouts side by side:
+#   OUTPUT_DIR=/var/www/html/videos/dash_single bash setup/prepare_video.sh single
 
 SOURCE_VIDEO_URL="http://commondatastorage.googleapis.com/gtv-videos-bucket/sample/BigBuckBunny.mp4"
 SOURCE_VIDEO_FILE="BigBuckBunny.mp4"
 TRIMMED_VIDEO_FILE="bbb_30s.mp4"
 DURATION=30 # Duration in seconds to trim to
-OUTPUT_DIR="/var/www/html/videos/dash"
+OUTPUT_DIR="${OUTPUT_DIR:-/var/www/html/videos/dash}"
+PACKAGING="${1:-segments}"
 TEMP_DIR="/tmp/bbb_processing"
 
 # --- Representaions ---
@@ -20,6 +28,14 @@ REPS=(
 )
 # Note: 1920x1080 might be too heavy for typical Mininet tests, using 720p as max.
 
+case "$PACKAGING" in
+    segments|single) ;;
+    *)
+        echo "Usage: $0 [segments|single]"
+        exit 1
+        ;;
+esac
+
 # --- Installation ---
 echo "Installing dependencies: ffmpeg and gpac (MP4Box)..."
 sudo apt-get update
@@ -73,8 +89,18 @@ for f in "${INPUT_FILES[@]}"; do
     MP4BOX_ARGS+="-add $f "
 done
 
-# Create DASH segments (e.g., 2 seconds long) and the manifest
-mp4box -dash 2000 -frag 2000 -rap -segment-name 'segment_$RepresentationID$_' -out manifest.mpd $MP4BOX_ARGS
+if [ "$PACKAGING" == "single" ]; then
+    # One file per representation with a sidx index; the manifest uses SegmentBase
+    # and the player fetches 2 second subsegments with byte-range requests
+    mp4box -dash 2000 -frag 2000 -rap -profile onDemand -out manifest.mpd $MP4BOX_ARGS
+    MEDIA_FILES=(*_dashinit.mp4)
+else
+    # Create DASH segments (e.g., 2 seconds long) and the manifest
+    mp4box -dash 2000 -frag 2000 -rap -segment-name 'segment_$RepresentationID$_' -out manifest.mpd $MP4BOX_ARGS
+    # Initialization segments are written as segment_<rep>_init.mp4 next to the .m4s files
+    shopt -s nullglob
+    MEDIA_FILES=(*.m4s segment_*init.mp4)
+fi
 
 if [ ! -f "manifest.mpd" ]; then
     echo "Error: MP4Box failed to create manifest.mpd"
@@ -83,11 +109,13 @@ if [ ! -f "manifest.mpd" ]; then
     exit 1
 fi
 
-echo "DASH packaging complete."
+echo "DASH packaging complete ($PACKAGING layout)."
 
 # --- Deployment ---
 echo "Moving DASH files to $OUTPUT_DIR..."
-sudo cp manifest.mpd *.m4s "$OUTPUT_DIR/"
+# Remove media left over from a previous run with the other layout
+sudo rm -f "$OUTPUT_DIR"/*.m4s "$OUTPUT_DIR"/segment_*init.mp4 "$OUTPUT_DIR"/*_dashinit.mp4
+sudo cp manifest.mpd "${MEDIA_FILES[@]}" "$OUTPUT_DIR/"
 
 # --- Permissions ---
 echo "Setting permissions for web server..."